@@ -0,0 +1,157 @@
+"""
+E2E Test Helpers
+Shared settings, browser setup and page actions used by the E2E tests
+"""
+
+from playwright.async_api import async_playwright
+import asyncio
+import os
+import re
+import zipfile
+
+BASE_URL = os.environ.get('E2E_BASE_URL', 'http://localhost:5173')
+ADMIN_EMAIL = 'admin@thenexusengine.com'
+ADMIN_PASSWORD = 'ChangeMe123!'
+
+# Requests the tests never assert on: static media/fonts and third-party trackers.
+# Anchored at the end of the URL so Vite's `?import` asset modules still load.
+BLOCKED_ASSETS = re.compile(r'\.(png|jpe?g|gif|webp|ico|woff2?|ttf|otf|mp4|webm)$')
+BLOCKED_HOSTS = re.compile(r'^https?://[^/]*(googletagmanager|google-analytics|doubleclick|segment|hotjar)\.')
+
+# Skip Chromium subsystems a headless test run never uses
+CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-extensions',
+    '--disable-background-networking',
+]
+
+async def launch_browser(p):
+    """Launch the headless Chromium the tests open their contexts in"""
+    return await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+async def _abort(route):
+    """Route handler that drops the request"""
+    await route.abort()
+
+async def block_assets(context):
+    """Abort images, fonts, media and trackers so page loads settle sooner"""
+    await context.route(BLOCKED_ASSETS, _abort)
+    await context.route(BLOCKED_HOSTS, _abort)
+
+def run_standalone(test):
+    """Run a single test against its own browser and return a process exit code"""
+    async def run():
+        async with async_playwright() as p:
+            browser = await launch_browser(p)
+            try:
+                return await test(browser)
+            finally:
+                await browser.close()
+
+    return 0 if asyncio.run(run()) else 1
+
+# Screenshots held in memory per test until save_shots() zips them
+_shots = {}
+
+async def snap(page, test, name):
+    """Capture a low-quality JPEG screenshot in memory for test"""
+    data = await page.screenshot(type='jpeg', quality=50)
+    _shots.setdefault(test, []).append((f'{name}.jpg', data))
+
+async def shot(page, test, name):
+    """Capture a happy-path screenshot, only when E2E_DEBUG_SHOTS is set"""
+    if os.environ.get('E2E_DEBUG_SHOTS'):
+        await snap(page, test, name)
+
+def save_shots(test):
+    """Write test's captured screenshots to /tmp/e2e_<test>.zip; return the path, if any"""
+    shots = _shots.pop(test, [])
+    if not shots:
+        return None
+
+    path = f'/tmp/e2e_{test}.zip'
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as z:
+        for name, data in shots:
+            z.writestr(name, data)
+    return path
+
+async def save_error_shots(page, test):
+    """Snap an error screenshot and save test's shots; never raises over the original failure"""
+    try:
+        await snap(page, test, 'error')
+    except Exception as e:
+        print(f"Could not capture error screenshot: {e}")
+    return save_shots(test)
+
+def login_form(page):
+    """Email, password and submit locators of the login form"""
+    return (
+        page.locator('input[type="email"]'),
+        page.locator('input[type="password"]'),
+        page.locator('button[type="submit"]'),
+    )
+
+async def login(page, base=BASE_URL, email=ADMIN_EMAIL, password=ADMIN_PASSWORD):
+    """Login (as admin by default) and wait for the dashboard"""
+    email_input, password_input, submit = login_form(page)
+    await page.goto(f'{base}/login', wait_until='domcontentloaded')
+    await email_input.fill(email)
+    await password_input.fill(password)
+    await submit.click()
+    await page.wait_for_url('**/dashboard', timeout=5000)
+    # The dashboard keeps polling, so wait for its nav instead of networkidle
+    await page.locator('a[href="/admin/publishers"]').wait_for(state='visible', timeout=5000)
+
+# Logged-in storage states (cookies + localStorage), keyed by event loop and credentials
+_storage_states = {}
+
+async def _fetch_storage_state(browser, base, email, password):
+    """Login in a throwaway context and return its storage state"""
+    context = await browser.new_context()
+    await block_assets(context)
+    page = await context.new_page()
+
+    try:
+        await login(page, base, email, password)
+        return await context.storage_state()
+    except Exception:
+        print(f"Login failed, screenshots saved to {await save_error_shots(page, 'auth')}")
+        raise
+    finally:
+        await context.close()
+
+def storage_state_for(browser, base=BASE_URL, email=ADMIN_EMAIL, password=ADMIN_PASSWORD):
+    """
+    Awaitable storage state of a logged-in session for these credentials.
+    The login runs once per (base, email, password); concurrent and later
+    callers in the same run share its result. A failed login is forgotten
+    so the next caller retries it.
+    """
+    # A future is bound to its loop, so each asyncio.run() logs in afresh
+    key = (asyncio.get_running_loop(), base, email, password)
+    if key not in _storage_states:
+        task = asyncio.ensure_future(_fetch_storage_state(browser, base, email, password))
+        task.add_done_callback(lambda t: _forget_failed_login(key, t))
+        _storage_states[key] = task
+    return _storage_states[key]
+
+def _forget_failed_login(key, task):
+    """Drop a login task that failed or was cancelled from the memo"""
+    if (task.cancelled() or task.exception()) and _storage_states.get(key) is task:
+        del _storage_states[key]
+
+def edit_publisher_link(page):
+    """Edit link of the first publisher in the publishers list"""
+    # Row 0 is the table header
+    first_row = page.get_by_role("row").nth(1)
+    return first_row.get_by_role("link", name="Edit")
+
+async def open_first_publisher(page):
+    """Open the publishers list and go to the first publisher's detail page"""
+    await page.goto(f'{BASE_URL}/admin/publishers', wait_until='domcontentloaded')
+    edit_link = edit_publisher_link(page)
+    await edit_link.wait_for(state='visible', timeout=5000)
+    await edit_link.click()
+    await page.wait_for_url('**/admin/publishers/*')
@@ -4,47 +4,239 @@ Run All E2E Tests
 Executes all Playwright E2E tests and generates a report
 """
 
-import subprocess
+from playwright.async_api import async_playwright
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
 import sys
+import time
 from pathlib import Path
 
-# Test files in order of execution
+from _helpers import BASE_URL, launch_browser, storage_state_for
+from test_ad_unit_creation import test_ad_unit_creation
+from test_admin_login import test_admin_login
+from test_bidder_configuration import test_bidder_configuration
+from test_publisher_crud import test_publisher_crud
+
+# Tests (run concurrently, summary reported in this order)
 TESTS = [
-    'test_admin_login.py',
-    'test_publisher_crud.py',
-    'test_bidder_configuration.py',
-    'test_ad_unit_creation.py',
+    test_admin_login,
+    test_publisher_crud,
+    test_bidder_configuration,
+    test_ad_unit_creation,
 ]
 
-def run_test(test_file):
-    """Run a single test file and return result"""
-    print(f"\n{'='*60}")
-    print(f"Running: {test_file}")
-    print('='*60)
+# Tests share no state, so they can run side by side in their own browser
+# contexts. Leave a couple of cores free for the API and Vite dev servers the
+# tests talk to.
+MAX_WORKERS = max((os.cpu_count() or 1) - 2, 1)
+
+# Inputs that decide whether a previous passing run is still valid
+ROOT = Path(__file__).resolve().parents[2]
+SOURCE_PATTERNS = [
+    'apps/*/src/**/*',
+    'apps/*/index.html',
+    'apps/*/*.config.*',
+    'apps/*/tsconfig*.json',
+    'apps/*/.env*',
+    'packages/*/src/**/*',
+    'tests/e2e/*.py',
+    'package.json',
+    'package-lock.json',
+    'apps/*/package.json',
+    'apps/*/package-lock.json',
+    'packages/*/package.json',
+]
+CACHE_DIR = Path(__file__).parent / '.e2e_cache'
+
+# Wall time of each test from previous runs, used to balance the workers
+TIMINGS_FILE = Path(__file__).parent / '.timings.json'
+
+def source_hash():
+    """
+    Hash the target URL, app sources and tests so unchanged trees can skip
+    the suite. A pass against one E2E_BASE_URL says nothing about another.
+    """
+    files = sorted({
+        path for pattern in SOURCE_PATTERNS
+        for path in ROOT.glob(pattern) if path.is_file()
+    })
+
+    digest = hashlib.sha256(BASE_URL.encode())
+    for path in files:
+        digest.update(str(path.relative_to(ROOT)).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+def passed_marker(source_digest, name):
+    """Marker recording that test name passed against source_digest"""
+    return CACHE_DIR / f'{source_digest}-{name}.passed'
+
+# Name of the test running in the current asyncio task, used to tag its output
+current_test = contextvars.ContextVar('current_test', default=None)
+
+class TaggedStdout:
+    """
+    stdout wrapper that prefixes each line printed by a running test with
+    [test_name], so output from concurrently running tests stays readable.
+    Partial lines are held per test until their newline arrives.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.partial = {}
+
+    def write(self, text):
+        name = current_test.get()
+        if name is None:
+            return self.stream.write(text)
+
+        *lines, rest = (self.partial.pop(name, '') + text).split('\n')
+        for line in lines:
+            self.stream.write(f"[{name}] {line}\n")
+        if rest:
+            self.partial[name] = rest
+        return len(text)
+
+    def end_test(self, name):
+        """Write out whatever the test printed without a trailing newline"""
+        rest = self.partial.pop(name, None)
+        if rest is not None:
+            self.stream.write(f"[{name}] {rest}\n")
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, attr):
+        return getattr(self.stream, attr)
+
+def load_timings():
+    """Load per-test wall times recorded by earlier runs"""
+    try:
+        return json.loads(TIMINGS_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_timings(timings):
+    """Persist per-test wall times for the next run"""
+    TIMINGS_FILE.write_text(json.dumps(timings, indent=2, sort_keys=True) + '\n')
 
-    result = subprocess.run(
-        ['python3', test_file],
-        cwd=Path(__file__).parent,
-        capture_output=False
-    )
+def make_buckets(tests, timings, workers):
+    """
+    Split tests into per-worker buckets of roughly equal wall time.
+    Longest-processing-time first: hand each test, slowest first, to the
+    bucket with the least work so far. Tests with no recorded time are
+    treated as the slowest known test so they get spread out.
+    """
+    default = max(timings.values(), default=1.0)
+    buckets = [[] for _ in range(min(workers, len(tests)))]
+    loads = [0.0] * len(buckets)
 
-    return result.returncode == 0
+    for test in sorted(tests, key=lambda t: timings.get(t, default), reverse=True):
+        lightest = loads.index(min(loads))
+        buckets[lightest].append(test)
+        loads[lightest] += timings.get(test, default)
+
+    return buckets
+
+async def run_test(test, browser):
+    """Run a single test in the shared browser and return (name, success, seconds)"""
+    name = test.__name__
+    print(f"▶️  Running: {name}")
+    started = time.monotonic()
+    token = current_test.set(name)
+
+    try:
+        success = await test(browser)
+    except Exception as e:
+        print(f"\n❌ {name} raised: {e}")
+        success = False
+    finally:
+        current_test.reset(token)
+        if isinstance(sys.stdout, TaggedStdout):
+            sys.stdout.end_test(name)
+
+    return name, success, time.monotonic() - started
+
+async def run_bucket(bucket, browser):
+    """Run one worker's share of the tests back to back"""
+    return [await run_test(test, browser) for test in bucket]
+
+async def run_pending(pending, results, timings):
+    """
+    Run pending tests concurrently in one browser, recording results and
+    timings. Returns False if the admin could not log in.
+    """
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+
+        try:
+            # Log in once up front; the other tests reuse the memoized session
+            print("🔑 Logging in as admin")
+            try:
+                await storage_state_for(browser)
+            except Exception as e:
+                print(f"\n❌ Admin login failed: {e}")
+                return False
+
+            buckets = make_buckets([t.__name__ for t in pending], timings, MAX_WORKERS)
+            by_name = {t.__name__: t for t in pending}
+
+            bucket_results = await asyncio.gather(*[
+                run_bucket([by_name[name] for name in bucket], browser)
+                for bucket in buckets
+            ])
+
+            for name, success, elapsed in (r for rs in bucket_results for r in rs):
+                results[name] = success
+
+                # A failure can bail out early, so only full runs feed the LPT buckets
+                if success:
+                    timings[name] = round(elapsed, 2)
+                else:
+                    print(f"\n⚠️  Test {name} failed. Continuing with remaining tests...")
+
+            return True
+        finally:
+            await browser.close()
 
 def main():
     """Run all tests and report results"""
+    # Skip work already proven against this exact source tree. Set
+    # E2E_NO_CACHE=1 to force a full run.
+    use_cache = not os.environ.get('E2E_NO_CACHE')
+    source_digest = source_hash()
+    suite_marker = CACHE_DIR / f'{source_digest}.passed'
+
+    if use_cache and suite_marker.exists():
+        print(f"✅ Sources unchanged since last passing run ({source_digest[:12]}), skipping E2E suite")
+        sys.exit(0)
+
+    names = [t.__name__ for t in TESTS]
+    cached = [n for n in names if use_cache and passed_marker(source_digest, n).exists()]
+    pending = [t for t in TESTS if t.__name__ not in cached]
+
     print("🚀 Starting E2E Test Suite")
     print("="*60)
-    print(f"Total tests: {len(TESTS)}")
+    print(f"Total tests: {len(TESTS)} | Cached: {len(cached)} | Workers: {MAX_WORKERS}")
     print("="*60)
 
-    results = {}
+    results = {name: True for name in cached}
 
-    for test in TESTS:
-        success = run_test(test)
-        results[test] = success
-
-        if not success:
-            print(f"\n⚠️  Test {test} failed. Continuing with remaining tests...")
+    if pending:
+        timings = load_timings()
+        with contextlib.redirect_stdout(TaggedStdout(sys.stdout)):
+            logged_in = asyncio.run(run_pending(pending, results, timings))
+        if not logged_in:
+            print("\n❌ Could not log in as admin. Aborting test run.")
+            sys.exit(1)
+        save_timings(timings)
 
     # Print summary
     print("\n" + "="*60)
@@ -54,19 +246,30 @@ def main():
     passed = sum(1 for v in results.values() if v)
     failed = len(results) - passed
 
-    for test, success in results.items():
-        status = "✅ PASSED" if success else "❌ FAILED"
-        print(f"{status}: {test}")
+    for name in names:
+        success = results[name]
+        if name in cached:
+            status = "✅ CACHED"
+        else:
+            status = "✅ PASSED" if success else "❌ FAILED"
+        print(f"{status}: {name}")
 
     print("="*60)
     print(f"Total: {len(results)} | Passed: {passed} | Failed: {failed}")
     print("="*60)
 
+    # Remember what passed so the next run against the same sources can skip it
+    CACHE_DIR.mkdir(exist_ok=True)
+    for test in pending:
+        if results[test.__name__]:
+            passed_marker(source_digest, test.__name__).touch()
+
     if failed > 0:
         print("\n⚠️  Some tests failed. Check screenshots in /tmp/")
-        print("Screenshots: /tmp/error_*.png")
+        print("Screenshots: /tmp/e2e_*.zip")
         sys.exit(1)
     else:
+        suite_marker.touch()
         print("\n✅ All tests passed!")
         sys.exit(0)
 
@@ -4,69 +4,78 @@ E2E Test: Admin Login Flow
 Tests the complete authentication workflow
 """
 
-from playwright.sync_api import sync_playwright, expect
+from playwright.async_api import expect
+from _helpers import (
+    ADMIN_EMAIL,
+    ADMIN_PASSWORD,
+    BASE_URL,
+    block_assets,
+    login_form,
+    run_standalone,
+    save_error_shots,
+    save_shots,
+    shot,
+)
 import sys
 
-def test_admin_login():
+async def test_admin_login(browser):
     """Test admin login and dashboard access"""
 
-    with sync_playwright() as p:
-        # Launch browser
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    context = await browser.new_context()
+    await block_assets(context)
+    page = await context.new_page()
+    email, password, submit = login_form(page)
 
-        print("📋 Test: Admin Login Flow")
-        print("=" * 50)
+    print("📋 Test: Admin Login Flow")
+    print("=" * 50)
 
-        try:
-            # 1. Navigate to login page
-            print("✓ Step 1: Navigate to login page")
-            page.goto('http://localhost:5173/login')
-            page.wait_for_load_state('networkidle')
-            page.screenshot(path='/tmp/01_login_page.png')
+    try:
+        # 1. Navigate to login page
+        print("✓ Step 1: Navigate to login page")
+        await page.goto(f'{BASE_URL}/login', wait_until='domcontentloaded')
+        await shot(page, 'test_admin_login', '01_login_page')
 
-            # 2. Verify login form exists
-            print("✓ Step 2: Verify login form elements")
-            expect(page.locator('input[type="email"]')).to_be_visible()
-            expect(page.locator('input[type="password"]')).to_be_visible()
-            expect(page.locator('button[type="submit"]')).to_be_visible()
+        # 2. Verify login form exists
+        print("✓ Step 2: Verify login form elements")
+        await expect(email).to_be_visible()
+        await expect(password).to_be_visible()
+        await expect(submit).to_be_visible()
 
-            # 3. Fill in credentials
-            print("✓ Step 3: Fill in login credentials")
-            page.fill('input[type="email"]', 'admin@thenexusengine.com')
-            page.fill('input[type="password"]', 'ChangeMe123!')
-            page.screenshot(path='/tmp/02_credentials_filled.png')
+        # 3. Fill in credentials
+        print("✓ Step 3: Fill in login credentials")
+        await email.fill(ADMIN_EMAIL)
+        await password.fill(ADMIN_PASSWORD)
+        await shot(page, 'test_admin_login', '02_credentials_filled')
 
-            # 4. Submit login form
-            print("✓ Step 4: Submit login form")
-            page.click('button[type="submit"]')
+        # 4. Submit login form
+        print("✓ Step 4: Submit login form")
+        await submit.click()
 
-            # 5. Wait for redirect to dashboard
-            print("✓ Step 5: Wait for dashboard redirect")
-            page.wait_for_url('**/dashboard', timeout=5000)
-            page.wait_for_load_state('networkidle')
-            page.screenshot(path='/tmp/03_dashboard.png')
+        # 5. Wait for redirect to dashboard
+        print("✓ Step 5: Wait for dashboard redirect")
+        await page.wait_for_url('**/dashboard', timeout=5000)
+        await shot(page, 'test_admin_login', '03_dashboard')
 
-            # 6. Verify dashboard elements
-            print("✓ Step 6: Verify dashboard loaded")
-            expect(page.locator('a[href="/admin/publishers"]')).to_be_visible()
+        # 6. Verify dashboard elements
+        print("✓ Step 6: Verify dashboard loaded")
+        await expect(page.locator('a[href="/admin/publishers"]')).to_be_visible()
 
-            # 7. Check for user menu/profile
-            print("✓ Step 7: Verify user is logged in")
-            # Look for any indicator of logged-in state (adjust selector as needed)
-            expect(page.get_by_role("button", name="User menu")).to_be_visible()
+        # 7. Check for user menu/profile
+        print("✓ Step 7: Verify user is logged in")
+        # Look for any indicator of logged-in state (adjust selector as needed)
+        await expect(page.get_by_role("button", name="User menu")).to_be_visible()
 
-            print("\n✅ All login tests passed!")
-            browser.close()
-            return True
+        print("\n✅ All login tests passed!")
+        save_shots('test_admin_login')
+        return True
 
-        except Exception as e:
-            print(f"\n❌ Test failed: {e}")
-            page.screenshot(path='/tmp/error_login.png')
-            print("Screenshot saved to /tmp/error_login.png")
-            browser.close()
-            return False
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Screenshots saved to {await save_error_shots(page, 'test_admin_login')}")
+        return False
+
+    finally:
+        await context.close()
 
 if __name__ == "__main__":
-    success = test_admin_login()
-    sys.exit(0 if success else 1)
+    sys.exit(run_standalone(test_admin_login))
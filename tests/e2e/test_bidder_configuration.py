@@ -4,71 +4,58 @@ E2E Test: Bidder Configuration
 Tests adding bidders and configuring their parameters
 """
 
-from playwright.sync_api import sync_playwright, expect
+from playwright.async_api import expect
+from _helpers import (
+    block_assets,
+    open_first_publisher,
+    run_standalone,
+    save_error_shots,
+    save_shots,
+    shot,
+    storage_state_for,
+)
 import sys
 
-def login(page):
-    """Helper function to login"""
-    page.goto('http://localhost:5173/login')
-    page.wait_for_load_state('networkidle')
-    page.fill('input[type="email"]', 'admin@thenexusengine.com')
-    page.fill('input[type="password"]', 'ChangeMe123!')
-    page.click('button[type="submit"]')
-    page.wait_for_url('**/dashboard', timeout=5000)
-    page.wait_for_load_state('networkidle')
-
-def test_bidder_configuration():
+async def test_bidder_configuration(browser):
     """Test bidder configuration workflow"""
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        print("📋 Test: Bidder Configuration")
-        print("=" * 50)
+    context = await browser.new_context(storage_state=await storage_state_for(browser))
+    await block_assets(context)
+    page = await context.new_page()
 
-        try:
-            # 1. Login
-            print("✓ Step 1: Login as admin")
-            login(page)
+    print("📋 Test: Bidder Configuration")
+    print("=" * 50)
 
-            # 2. Navigate to first publisher
-            print("✓ Step 2: Navigate to Publishers")
-            page.click('a[href="/admin/publishers"]')
-            page.wait_for_load_state('networkidle')
+    try:
+        # 1. Open first publisher (already logged in via shared session)
+        print("✓ Step 1: Open first publisher")
+        await open_first_publisher(page)
+        await shot(page, 'test_bidder_configuration', 'bidders_tab')
 
-            # 3. Click on first publisher
-            print("✓ Step 3: Open first publisher")
-            # Click on "Edit" button for first publisher
-            page.click('button:has-text("Edit"), a:has-text("Edit")')
-            page.wait_for_load_state('networkidle')
-            page.screenshot(path='/tmp/bidders_tab.png')
+        # 2. Navigate to Bidders tab
+        print("✓ Step 2: Navigate to Bidders section")
+        # Click on the Bidders tab link
+        bidders_tab = page.locator('text="Bidders"').first
+        await bidders_tab.click()
+        await shot(page, 'test_bidder_configuration', 'bidders_tab_clicked')
 
-            # 4. Navigate to Bidders tab
-            print("✓ Step 4: Navigate to Bidders section")
-            # Click on the Bidders tab link
-            bidders_tab = page.locator('text="Bidders"').first
-            bidders_tab.click()
-            page.wait_for_timeout(1000)
-            page.screenshot(path='/tmp/bidders_tab_clicked.png')
+        # 3. Verify bidders section loaded with Add Bidder button
+        print("✓ Step 3: Verify bidder controls available")
+        await expect(page.get_by_role("button", name="Add Bidder")).to_be_visible(timeout=5000)
+        await shot(page, 'test_bidder_configuration', 'bidders_tab_success')
 
-            # 5. Verify bidders section loaded with Add Bidder button
-            print("✓ Step 5: Verify bidder controls available")
-            expect(page.get_by_role("button", name="Add Bidder")).to_be_visible(timeout=5000)
-            page.screenshot(path='/tmp/bidders_tab_success.png')
+        print("\n✅ All bidder configuration tests passed!")
+        save_shots('test_bidder_configuration')
+        return True
 
-            print("\n✅ All bidder configuration tests passed!")
-            browser.close()
-            return True
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        print(f"Screenshots saved to {await save_error_shots(page, 'test_bidder_configuration')}")
+        print(f"Current URL: {page.url}")
+        return False
 
-        except Exception as e:
-            print(f"\n❌ Test failed: {e}")
-            page.screenshot(path='/tmp/error_bidder_config.png')
-            print("Screenshot saved to /tmp/error_bidder_config.png")
-            print(f"Current URL: {page.url}")
-            browser.close()
-            return False
+    finally:
+        await context.close()
 
 if __name__ == "__main__":
-    success = test_bidder_configuration()
-    sys.exit(0 if success else 1)
+    sys.exit(run_standalone(test_bidder_configuration))